@@ -1,15 +1,23 @@
 # app/api_clients.py - Product API integrations
 
-import requests
 import asyncio
+import hashlib
+import heapq
+import logging
 import aiohttp
-from typing import List, Dict, Any, Optional
+import orjson
+import re
+from cachetools import TTLCache
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple, Callable, Awaitable
 from .models import Product, ProductSearchRequest, ProductSearchResponse, ProductDetailsResponse
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # API Configuration
 FAKESTORE_API = "https://fakestoreapi.com"
 EBAY_API = "https://api.ebay.com/buy/browse/v1"
@@ -19,147 +27,337 @@ WALMART_API = "https://developer.api.walmartlabs.com/v1"
 EBAY_CLIENT_ID = os.getenv("EBAY_CLIENT_ID", "")
 WALMART_API_KEY = os.getenv("WALMART_API_KEY", "")
 
+# Longest query sent upstream; matches the query processor's text cap
+MAX_QUERY_LENGTH = 600
+
+# Search result cache: repeated queries within the TTL skip the upstream APIs
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "1024"))
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "60"))
+_search_cache: TTLCache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+
+# FakeStore has no search endpoint, so every search scans the whole catalog.
+# The parsed catalog is kept briefly so different queries share one download.
+CATALOG_CACHE_TTL = int(os.getenv("CATALOG_CACHE_TTL", "300"))
+_catalog_cache: TTLCache = TTLCache(maxsize=1, ttl=CATALOG_CACHE_TTL)
+
+# Optional Redis cache shared by all workers (enabled when REDIS_URL is set)
+REDIS_URL = os.getenv("REDIS_URL", "")
+REDIS_CACHE_TTL = int(os.getenv("REDIS_CACHE_TTL", "600"))
+# Redis is only a cache, so an unreachable server must fail fast (seconds)
+# rather than stall searches until the OS TCP timeout
+REDIS_TIMEOUT = float(os.getenv("REDIS_TIMEOUT", "0.2"))
+_redis = None
+_redis_error: Optional[str] = None
+
+# Upstream request timeout in seconds
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "5"))
+
+# A rate-limited (429) request is retried once after the server's
+# Retry-After delay, capped so one throttled source can't stall a search
+RETRY_AFTER_MAX = float(os.getenv("RETRY_AFTER_MAX", "2"))
+
+# Connection pool caps. Each product API is its own host, so the per-host cap
+# bounds concurrent requests per source and keeps us under upstream rate limits.
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_PER_HOST = int(os.getenv("HTTP_MAX_PER_HOST", "20"))
+
+# Shared HTTP session, created once and reused across requests so that
+# connections, DNS lookups and TLS state are pooled instead of rebuilt per call
+_session: Optional[aiohttp.ClientSession] = None
+
+def get_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=HTTP_MAX_CONNECTIONS,
+                limit_per_host=HTTP_MAX_PER_HOST,
+                ttl_dns_cache=300
+            ),
+            # A stuck upstream should not hold a search open indefinitely
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+        )
+    return _session
+
+async def close_session():
+    """Close the shared aiohttp session and Redis client (called on app shutdown)."""
+    global _session, _redis
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+def _get_redis():
+    """Create and cache the Redis client when REDIS_URL is configured."""
+    global _redis, _redis_error
+    if not REDIS_URL or _redis_error:
+        return None
+    if _redis is not None:
+        return _redis
+    try:
+        import redis.asyncio as aioredis
+        _redis = aioredis.from_url(
+            REDIS_URL,
+            socket_connect_timeout=REDIS_TIMEOUT,
+            socket_timeout=REDIS_TIMEOUT
+        )
+        return _redis
+    except Exception as e:
+        _redis_error = f"Redis init failed: {e}"
+        logger.warning(_redis_error)
+        return None
+
+async def _shared_cache_get(key: str) -> Optional[ProductSearchResponse]:
+    """Look up a search response in Redis; any Redis or decode failure counts as a miss."""
+    client = _get_redis()
+    if client is None:
+        return None
+    try:
+        raw = await client.get(key)
+    except Exception as e:
+        logger.warning("Redis get failed: %s", e)
+        return None
+    if not raw:
+        return None
+    try:
+        return ProductSearchResponse.model_validate(orjson.loads(raw))
+    except Exception as e:
+        # Corrupt, or written by a release with a different schema (e.g. during
+        # a rolling deploy): drop the entry so the next search rewrites it
+        logger.warning("Discarding unreadable Redis entry %s: %s", key, e)
+        try:
+            await client.delete(key)
+        except Exception as e:
+            logger.warning("Redis delete failed: %s", e)
+        return None
+
+async def _shared_cache_set(key: str, response: ProductSearchResponse):
+    """Store a search response in Redis with REDIS_CACHE_TTL expiry."""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        await client.set(key, orjson.dumps(response.model_dump()), ex=REDIS_CACHE_TTL)
+    except Exception as e:
+        logger.warning("Redis set failed: %s", e)
+
+# Upstream calls in progress, keyed by what they fetch. Concurrent callers
+# asking for the same thing await one task instead of each calling the API.
+_inflight: Dict[str, asyncio.Future] = {}
+
+async def _coalesce(key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Run fetch() once for all concurrent callers with the same key."""
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield so one caller being cancelled doesn't cancel the others' fetch
+    return await asyncio.shield(task)
+
+def _retry_delay(retry_after: Optional[str]) -> float:
+    """Seconds to wait before retrying a 429, from its Retry-After header."""
+    try:
+        delay = float(retry_after)
+    except (TypeError, ValueError):
+        # Missing, or the HTTP-date form
+        delay = 1.0
+    return min(max(delay, 0.0), RETRY_AFTER_MAX)
+
+async def _get_json(url: str, **kwargs) -> Any:
+    """GET a URL on the shared session and decode its JSON body (None unless 200)."""
+    session = get_session()
+    for attempt in range(2):
+        async with session.get(url, **kwargs) as response:
+            if response.status == 200:
+                return orjson.loads(await response.read())
+            if response.status != 429 or attempt:
+                return None
+            delay = _retry_delay(response.headers.get('Retry-After'))
+        logger.warning("Rate limited by %s, retrying in %.1fs", url, delay)
+        await asyncio.sleep(delay)
+
+_PRICE_CLEAN = str.maketrans('', '', '$,')
+
+def _to_float(value: Any, default: float = 0.0) -> float:
+    """Parse a price given as a number or a string such as "$1,299.99"."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(str(value).translate(_PRICE_CLEAN))
+    except (ValueError, TypeError):
+        return default
+
+def _fallback_id(item_url: Optional[str], title: Optional[str]) -> str:
+    """Stable id for items an API returned without one (same input, same id across restarts)."""
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update((item_url or '').encode())
+    digest.update(b'|')
+    digest.update((title or '').encode())
+    return digest.hexdigest()
+
 class FakeStoreClient:
     """FakeStore API client - Free, no authentication required"""
     
     @staticmethod
-    async def search_products(request: ProductSearchRequest) -> List[Product]:
-        """Search products using FakeStore API"""
+    def _to_product(item: Dict[str, Any], price: float) -> Product:
+        """Build a Product from a FakeStore catalog item"""
+        return Product(
+            id=str(item['id']),
+            title=item['title'],
+            price=price,
+            currency="USD",
+            image_url=item.get('image'),
+            description=item.get('description'),
+            category=item.get('category'),
+            rating=item.get('rating', {}).get('rate'),
+            availability="in_stock",
+            url=f"{FAKESTORE_API}/products/{item['id']}",
+            source="fakestore"
+        )
+    
+    @staticmethod
+    async def _get_catalog() -> Optional[List[Dict[str, Any]]]:
+        """Return the parsed FakeStore catalog, reusing a recent copy"""
+        catalog = _catalog_cache.get("products")
+        if catalog is None:
+            # Searches that miss at the same time share one download
+            catalog = await _coalesce("fakestore:catalog", FakeStoreClient._fetch_catalog)
+        return catalog
+    
+    @staticmethod
+    async def _fetch_catalog() -> Optional[List[Dict[str, Any]]]:
+        """Download and parse the FakeStore catalog, caching it on success"""
+        catalog = await _get_json(f"{FAKESTORE_API}/products")
+        if catalog is not None:
+            _catalog_cache["products"] = catalog
+        return catalog
+    
+    @staticmethod
+    async def search_products(request: ProductSearchRequest) -> Optional[List[Product]]:
+        """Search products using FakeStore API (None if the API call failed)"""
         try:
             # FakeStore doesn't have search, so we'll get all products and filter
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{FAKESTORE_API}/products") as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        products = []
-                        
-                        for item in data:
-                            # Apply filters
-                            if request.category and request.category.lower() not in item.get('category', '').lower():
-                                continue
-                                
-                            if request.min_price and item.get('price', 0) < request.min_price:
-                                continue
-                                
-                            if request.max_price and item.get('price', 0) > request.max_price:
-                                continue
-                                
-                            if request.brand and request.brand.lower() not in item.get('title', '').lower():
-                                continue
-                            
-                            # Check if query matches
-                            if request.query.lower() not in item.get('title', '').lower() and \
-                               request.query.lower() not in item.get('description', '').lower():
-                                continue
-                            
-                            product = Product(
-                                id=str(item['id']),
-                                title=item['title'],
-                                price=float(item['price']),
-                                currency="USD",
-                                image_url=item.get('image'),
-                                description=item.get('description'),
-                                category=item.get('category'),
-                                rating=item.get('rating', {}).get('rate'),
-                                availability="in_stock",
-                                url=f"{FAKESTORE_API}/products/{item['id']}",
-                                source="fakestore"
-                            )
-                            products.append(product)
-                            
-                            if len(products) >= request.limit:
-                                break
-                        
-                        return products
-                    else:
-                        return []
+            data = await FakeStoreClient._get_catalog()
+            if data is None:
+                return None
+            products = []
+
+            # Filter terms are the same for every item, so normalize them once
+            query_lower = request.query.lower()
+            category_lower = request.category.lower() if request.category else None
+            brand_lower = request.brand.lower() if request.brand else None
+            min_price = request.min_price
+            max_price = request.max_price
+
+            for item in data:
+                # Apply filters (numeric price checks first, they are the cheapest)
+                price = _to_float(item.get('price'))
+
+                if min_price and price < min_price:
+                    continue
+
+                if max_price and price > max_price:
+                    continue
+
+                if category_lower and category_lower not in item.get('category', '').lower():
+                    continue
+
+                title_lower = item.get('title', '').lower()
+
+                if brand_lower and brand_lower not in title_lower:
+                    continue
+
+                # Check if query matches
+                if query_lower not in title_lower and \
+                   query_lower not in item.get('description', '').lower():
+                    continue
+                
+                products.append(FakeStoreClient._to_product(item, price))
+                
+                if len(products) >= request.limit:
+                    break
+            
+            return products
         except Exception as e:
-            print(f"FakeStore API error: {e}")
-            return []
+            logger.warning("FakeStore API error: %s", e)
+            return None
 
     @staticmethod
     async def get_product_details(product_id: str) -> Optional[Product]:
         """Get product details from FakeStore"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{FAKESTORE_API}/products/{product_id}") as response:
-                    if response.status == 200:
-                        item = await response.json()
-                        return Product(
-                            id=str(item['id']),
-                            title=item['title'],
-                            price=float(item['price']),
-                            currency="USD",
-                            image_url=item.get('image'),
-                            description=item.get('description'),
-                            category=item.get('category'),
-                            rating=item.get('rating', {}).get('rate'),
-                            availability="in_stock",
-                            url=f"{FAKESTORE_API}/products/{item['id']}",
-                            source="fakestore"
-                        )
-                    return None
+            item = await _get_json(f"{FAKESTORE_API}/products/{product_id}")
+            if item is None:
+                return None
+            return FakeStoreClient._to_product(item, _to_float(item.get('price')))
         except Exception as e:
-            print(f"FakeStore details error: {e}")
+            logger.warning("FakeStore details error: %s", e)
             return None
 
+# eBay API requires OAuth, simplified version here
+# In production, you'd implement proper OAuth flow
+# The token comes from the environment, so the headers are built once and
+# shared (read-only) by every request
+_EBAY_HEADERS = {
+    'Authorization': f'Bearer {EBAY_CLIENT_ID}',
+    'Content-Type': 'application/json'
+}
+
 class eBayClient:
     """eBay API client"""
     
     @staticmethod
-    async def search_products(request: ProductSearchRequest) -> List[Product]:
-        """Search products using eBay API"""
-        if not EBAY_CLIENT_ID:
+    async def search_products(request: ProductSearchRequest) -> Optional[List[Product]]:
+        """Search products using eBay API (None if the API call failed)"""
+        # Keyword search only, so an empty query has nothing to ask for
+        if not EBAY_CLIENT_ID or not request.query:
             return []
             
         try:
-            # eBay API requires OAuth, simplified version here
-            # In production, you'd implement proper OAuth flow
-            headers = {
-                'Authorization': f'Bearer {EBAY_CLIENT_ID}',
-                'Content-Type': 'application/json'
-            }
-            
             params = {
                 'q': request.query,
                 'limit': min(request.limit, 20)
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{EBAY_API}/item_summary/search", 
-                                      headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        products = []
-                        
-                        for item in data.get('itemSummaries', []):
-                            product = Product(
-                                id=item.get('itemId', ''),
-                                title=item.get('title', ''),
-                                price=float(item.get('price', {}).get('value', 0)),
-                                currency=item.get('price', {}).get('currency', 'USD'),
-                                image_url=item.get('image', {}).get('imageUrl'),
-                                description=item.get('shortDescription'),
-                                category=item.get('categories', [{}])[0].get('categoryName'),
-                                availability="available" if item.get('buyingOptions') else "unavailable",
-                                url=item.get('itemWebUrl'),
-                                source="ebay"
-                            )
-                            products.append(product)
-                        
-                        return products
-                    return []
+            data = await _get_json(f"{EBAY_API}/item_summary/search",
+                                   headers=_EBAY_HEADERS, params=params)
+            if data is None:
+                return None
+            products = []
+            
+            for item in data.get('itemSummaries', []):
+                price_info = item.get('price', {})
+                product = Product(
+                    id=item.get('itemId') or _fallback_id(item.get('itemWebUrl'), item.get('title')),
+                    title=item.get('title', ''),
+                    price=_to_float(price_info.get('value')),
+                    currency=price_info.get('currency', 'USD'),
+                    image_url=item.get('image', {}).get('imageUrl'),
+                    description=item.get('shortDescription'),
+                    category=item.get('categories', [{}])[0].get('categoryName'),
+                    availability="available" if item.get('buyingOptions') else "unavailable",
+                    url=item.get('itemWebUrl'),
+                    source="ebay"
+                )
+                products.append(product)
+            
+            return products
         except Exception as e:
-            print(f"eBay API error: {e}")
-            return []
+            logger.warning("eBay API error: %s", e)
+            return None
 
 class WalmartClient:
     """Walmart API client"""
     
     @staticmethod
-    async def search_products(request: ProductSearchRequest) -> List[Product]:
-        """Search products using Walmart API"""
-        if not WALMART_API_KEY:
+    async def search_products(request: ProductSearchRequest) -> Optional[List[Product]]:
+        """Search products using Walmart API (None if the API call failed)"""
+        # Keyword search only, so an empty query has nothing to ask for
+        if not WALMART_API_KEY or not request.query:
             return []
             
         try:
@@ -169,37 +367,39 @@ class WalmartClient:
                 'numItems': min(request.limit, 25)
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{WALMART_API}/search", params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        products = []
-                        
-                        for item in data.get('items', []):
-                            product = Product(
-                                id=str(item.get('itemId', '')),
-                                title=item.get('name', ''),
-                                price=float(item.get('salePrice', item.get('msrp', 0))),
-                                currency="USD",
-                                image_url=item.get('mediumImage'),
-                                description=item.get('shortDescription'),
-                                category=item.get('categoryPath'),
-                                rating=item.get('customerRating'),
-                                availability="in_stock" if item.get('stock') == 'Available' else "out_of_stock",
-                                url=item.get('productUrl'),
-                                source="walmart"
-                            )
-                            products.append(product)
-                        
-                        return products
-                    return []
+            data = await _get_json(f"{WALMART_API}/search", params=params)
+            if data is None:
+                return None
+            products = []
+            
+            for item in data.get('items', []):
+                product = Product(
+                    id=str(item.get('itemId') or _fallback_id(item.get('productUrl'), item.get('name'))),
+                    title=item.get('name', ''),
+                    price=_to_float(item.get('salePrice', item.get('msrp'))),
+                    currency="USD",
+                    image_url=item.get('mediumImage'),
+                    description=item.get('shortDescription'),
+                    category=item.get('categoryPath'),
+                    rating=item.get('customerRating'),
+                    availability="in_stock" if item.get('stock') == 'Available' else "out_of_stock",
+                    url=item.get('productUrl'),
+                    source="walmart"
+                )
+                products.append(product)
+            
+            return products
         except Exception as e:
-            print(f"Walmart API error: {e}")
-            return []
+            logger.warning("Walmart API error: %s", e)
+            return None
 
-# Unified search function
-async def search_products_unified(request: ProductSearchRequest) -> ProductSearchResponse:
-    """Search products across all available APIs"""
+# Punctuation and spacing differ between sources for the same product
+# ("Men's Cotton Jacket" vs "Mens Cotton  Jacket"), so titles are compared
+# with runs of non-word characters removed
+_NON_WORD = re.compile(r'\W+')
+
+async def _search_sources(request: ProductSearchRequest, cache_key: Tuple, shared_key: str) -> ProductSearchResponse:
+    """Query every API, merge and rank the results, and cache a complete response"""
     
     # Run searches in parallel
     tasks = [
@@ -210,34 +410,44 @@ async def search_products_unified(request: ProductSearchRequest) -> ProductSearc
     
     results = await asyncio.gather(*tasks, return_exceptions=True)
     
-    # Combine results
+    # Combine results. A source that failed (None or an exception) is left out
+    # of this response, which is then not cached (locally or in Redis) so the
+    # next search retries it.
     all_products = []
+    source_failed = False
     for result in results:
         if isinstance(result, list):
             all_products.extend(result)
-        elif isinstance(result, Exception):
-            print(f"API search error: {result}")
+        else:
+            source_failed = True
+            if isinstance(result, Exception):
+                logger.warning("API search error: %s", result)
     
-    # Remove duplicates based on title similarity
-    unique_products = []
+    # Remove duplicates based on title similarity or a shared product URL.
+    # The relevance key is built here too so each title is lowercased only once.
+    query_lower = request.query.lower()
+    decorated = []
     seen_titles = set()
+    seen_urls = set()
     
     for product in all_products:
         title_lower = product.title.lower()
-        if title_lower not in seen_titles:
-            seen_titles.add(title_lower)
-            unique_products.append(product)
-    
-    # Sort by relevance (simple implementation)
-    unique_products.sort(key=lambda x: (
-        request.query.lower() in x.title.lower(),
-        x.rating or 0
-    ), reverse=True)
+        title_key = _NON_WORD.sub('', title_lower)
+        if title_key in seen_titles or (product.url and product.url in seen_urls):
+            continue
+        seen_titles.add(title_key)
+        if product.url:
+            seen_urls.add(product.url)
+        decorated.append((query_lower in title_lower, product.rating or 0, product))
     
-    # Limit results
-    limited_products = unique_products[:request.limit]
+    # Rank by relevance (simple implementation), keeping only the top `limit`.
+    # nlargest matches sorted(..., reverse=True)[:limit], ties included.
+    top_ranked = heapq.nlargest(request.limit, decorated, key=itemgetter(0, 1))
+    limited_products = [entry[2] for entry in top_ranked]
     
-    return ProductSearchResponse(
+    # Every field is already validated (Products were built by the clients),
+    # so skip re-running validation on the wrapper
+    response = ProductSearchResponse.model_construct(
         products=limited_products,
         total_results=len(limited_products),
         query=request.query,
@@ -248,6 +458,62 @@ async def search_products_unified(request: ProductSearchRequest) -> ProductSearc
             "brand": request.brand
         }
     )
+    if not source_failed:
+        _search_cache[cache_key] = response
+        await _shared_cache_set(shared_key, response)
+    return response
+
+# Unified search function
+async def search_products_unified(request: ProductSearchRequest) -> ProductSearchResponse:
+    """Search products across all available APIs"""
+    
+    # Collapse stray whitespace (common in transcribed queries) so that
+    # equivalent queries match the same products and share a cache entry.
+    # Overlong queries (e.g. a whole voice transcript) are clamped, not
+    # rejected, to bound upstream requests and cache keys.
+    query = " ".join(request.query.split())[:MAX_QUERY_LENGTH].rstrip()
+    search_request = request
+    if query != request.query:
+        search_request = request.model_copy(update={"query": query})
+    
+    # Serve repeated searches from the cache. Filters are matched
+    # case-insensitively, so the key uses their lowercased form.
+    cache_key = (
+        query.lower(),
+        request.category.lower() if request.category else None,
+        request.min_price,
+        request.max_price,
+        request.brand.lower() if request.brand else None,
+        request.limit
+    )
+    filters_applied = {
+        "category": request.category,
+        "min_price": request.min_price,
+        "max_price": request.max_price,
+        "brand": request.brand
+    }
+    cached = _search_cache.get(cache_key)
+    if cached is None:
+        # Fall back to the cache shared with other workers, if configured
+        shared_key = "pf:search:" + hashlib.blake2b(repr(cache_key).encode(), digest_size=16).hexdigest()
+        cached = await _shared_cache_get(shared_key)
+        if cached is not None:
+            _search_cache[cache_key] = cached
+        else:
+            # Identical searches already in flight share one set of API calls
+            cached = await _coalesce(
+                shared_key, lambda: _search_sources(search_request, cache_key, shared_key)
+            )
+    
+    # Cached responses are shared; Products are frozen, so only the list needs
+    # copying per caller
+    return cached.model_copy(
+        update={
+            "products": list(cached.products),
+            "query": request.query,
+            "filters_applied": filters_applied
+        }
+    )
 
 async def get_product_details(product_id: str, source: str = "fakestore") -> ProductDetailsResponse:
     """Get detailed product information"""
@@ -259,7 +525,7 @@ async def get_product_details(product_id: str, source: str = "fakestore") -> Pro
         product = None
     
     if product:
-        return ProductDetailsResponse(
+        return ProductDetailsResponse.model_construct(
             product=product,
             additional_info={
                 "source": source,
@@ -269,16 +535,16 @@ async def get_product_details(product_id: str, source: str = "fakestore") -> Pro
     else:
         raise Exception(f"Product not found: {product_id}")
 
+# FakeStore categories (static, so built once at import)
+FAKESTORE_CATEGORIES: Tuple[Dict[str, Any], ...] = (
+    {"id": "electronics", "name": "Electronics", "source": "fakestore"},
+    {"id": "jewelery", "name": "Jewelry", "source": "fakestore"},
+    {"id": "men's clothing", "name": "Men's Clothing", "source": "fakestore"},
+    {"id": "women's clothing", "name": "Women's Clothing", "source": "fakestore"}
+)
+
 async def get_categories() -> List[Dict[str, Any]]:
     """Get available product categories"""
     
-    # FakeStore categories
-    fakestore_categories = [
-        {"id": "electronics", "name": "Electronics", "source": "fakestore"},
-        {"id": "jewelery", "name": "Jewelry", "source": "fakestore"},
-        {"id": "men's clothing", "name": "Men's Clothing", "source": "fakestore"},
-        {"id": "women's clothing", "name": "Women's Clothing", "source": "fakestore"}
-    ]
-    
     # You can add more categories from other APIs
-    return fakestore_categories
+    return list(FAKESTORE_CATEGORIES)
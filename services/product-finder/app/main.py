@@ -1,19 +1,38 @@
 # app/main.py (product-finder)
 
-from fastapi import FastAPI, HTTPException, Query
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
-import requests
-import os
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 
 load_dotenv()
 
+from .api_clients import (
+    search_products_unified,
+    get_product_details as fetch_product_details,
+    get_categories,
+    get_session,
+    close_session,
+)
+
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open the shared HTTP session once for the app's lifetime
+    get_session()
+    yield
+    await close_session()
+
 app = FastAPI(
     title="VoiceMart Product Finder",
     version="1.0.0",
-    description="Product search and discovery API for VoiceMart Shopping Assistant"
+    description="Product search and discovery API for VoiceMart Shopping Assistant",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -27,12 +46,16 @@ app.add_middleware(
 
 # Pydantic models (import from dedicated models module to avoid duplication)
 from .models import (
-    Product,
     ProductSearchRequest,
     ProductSearchResponse,
-    ProductDetailsResponse,
+    BatchSearchRequest,
+    BatchSearchResponse,
 )
 
+# Max batched searches (across all batch requests) running at the same time
+BATCH_CONCURRENCY = 16
+_batch_semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -42,6 +65,7 @@ async def root():
         "health": "/health",
         "endpoints": {
             "search": "/v1/products:search",
+            "batch_search": "/v1/products:batch-search",
             "details": "/v1/products:details",
             "categories": "/v1/products:categories"
         }
@@ -51,87 +75,70 @@ async def root():
 def health():
     return {"status": "ok"}
 
-# Product search endpoint
+# Product search endpoint. Each endpoint is also served at a path without
+# the colon, to avoid %3A encoding issues in some clients; the aliases are
+# left out of the OpenAPI schema so operation ids stay unique.
 @app.post("/v1/products:search", response_model=ProductSearchResponse)
+@app.post("/v1/products/search", response_model=ProductSearchResponse, include_in_schema=False)
 async def search_products(request: ProductSearchRequest):
     """
     Search for products across multiple APIs.
     """
     try:
-        from .api_clients import search_products_unified
         result = await search_products_unified(request)
         return result
     except Exception as e:
+        logger.warning("Product search failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Product search failed: {str(e)}")
 
-# Alias without colon to avoid %3A encoding issues in some clients
-@app.post("/v1/products/search", response_model=ProductSearchResponse)
-async def search_products_alias(request: ProductSearchRequest):
+async def _run_batch(payload: BatchSearchRequest) -> BatchSearchResponse:
+    async def run_one(request: ProductSearchRequest) -> ProductSearchResponse:
+        async with _batch_semaphore:
+            return await search_products_unified(request)
+
+    responses = await asyncio.gather(*[run_one(r) for r in payload.requests])
+    return BatchSearchResponse(responses=responses)
+
+# Batch search endpoint: several searches in one call, run concurrently
+@app.post("/v1/products:batch-search", response_model=BatchSearchResponse)
+@app.post("/v1/products/batch-search", response_model=BatchSearchResponse, include_in_schema=False)
+async def batch_search_products(payload: BatchSearchRequest):
+    """
+    Run several product searches in one request.
+    """
     try:
-        from .api_clients import search_products_unified
-        result = await search_products_unified(request)
-        return result
+        return await _run_batch(payload)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Product search failed: {str(e)}")
+        logger.warning("Batch product search failed: %s", e)
+        raise HTTPException(status_code=500, detail=f"Batch product search failed: {str(e)}")
 
 # Product details endpoint
 @app.get("/v1/products:details")
+@app.get("/v1/products/details", include_in_schema=False)
 async def get_product_details(product_id: str, source: str = "fakestore"):
     """
     Get detailed information about a specific product.
     """
     try:
-        from .api_clients import get_product_details
-        result = await get_product_details(product_id, source)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get product details: {str(e)}")
-
-# Alias without colon
-@app.get("/v1/products/details")
-async def get_product_details_alias(product_id: str, source: str = "fakestore"):
-    try:
-        from .api_clients import get_product_details
-        result = await get_product_details(product_id, source)
+        result = await fetch_product_details(product_id, source)
         return result
     except Exception as e:
+        logger.warning("Failed to get product details: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get product details: {str(e)}")
 
 # Product categories endpoint
 @app.get("/v1/products:categories")
+@app.get("/v1/products/categories", include_in_schema=False)
 async def get_product_categories():
     """
     Get available product categories.
     """
     try:
-        from .api_clients import get_categories
-        categories = await get_categories()
-        return {
-            "categories": categories,
-            "total": len(categories)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get categories: {str(e)}")
-
-# Alias without colon
-@app.get("/v1/products/categories")
-async def get_product_categories_alias():
-    try:
-        from .api_clients import get_categories
         categories = await get_categories()
         return {
             "categories": categories,
             "total": len(categories)
         }
     except Exception as e:
+        logger.warning("Failed to get categories: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get categories: {str(e)}")
-
-
-
-
-
-
-
-
-
-
@@ -1,9 +1,13 @@
 # app/models.py - Product finder models
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 
 class Product(BaseModel):
+    # Products are never mutated after the API clients build them. Freezing
+    # lets cached search results share them instead of deep-copying.
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     id: str
     title: str
     price: float
@@ -34,3 +38,9 @@ class ProductSearchResponse(BaseModel):
 class ProductDetailsResponse(BaseModel):
     product: Product
     additional_info: Optional[Dict[str, Any]] = None
+
+class BatchSearchRequest(BaseModel):
+    requests: List[ProductSearchRequest] = Field(..., min_length=1, max_length=20)
+
+class BatchSearchResponse(BaseModel):
+    responses: List[ProductSearchResponse]
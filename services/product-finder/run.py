@@ -11,6 +11,8 @@ import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 if __name__ == "__main__":
+    # uvicorn's default loop/http "auto" settings pick uvloop and httptools
+    # when they are installed (see requirements.txt)
     uvicorn.run(
         "app.main:app",
         host="127.0.0.1",
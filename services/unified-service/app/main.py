@@ -1,30 +1,48 @@
 # app/main.py (unified-service)
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Header
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, File, UploadFile, HTTPException, Form
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.responses import JSONResponse
-from pydantic import BaseModel, Field
-from typing import Optional, Any, Dict, List
-import os
-import requests
+from fastapi.responses import ORJSONResponse
+from typing import Optional
 from dotenv import load_dotenv
 
 # Import local modules
 from .stt_engine import transcribe_audio, is_allowed_mime
 from .config import MAX_UPLOAD_MB
 from .models import (
-    TranscriptionResult, TranscriptionSegment, QueryRequest, QueryResponse, Product, 
-    ProductSearchRequest, ProductSearchResponse, ProductDetailsResponse,
+    TranscriptionResult, QueryRequest, QueryResponse,
+    ProductSearchRequest, ProductSearchResponse,
     VoiceUnderstandResponse
 )
 from .processor import process_query
+from .product_finder import (
+    search_products,
+    get_product_details,
+    get_categories,
+    get_session,
+    close_session,
+)
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open the shared HTTP session used by product search for the app's lifetime
+    get_session()
+    yield
+    await close_session()
+
 app = FastAPI(
     title="VoiceMart Unified Service",
     version="1.0.0",
-    description="Unified API combining Speech-to-Text and Query Processing for VoiceMart Shopping Assistant"
+    description="Unified API combining Speech-to-Text and Query Processing for VoiceMart Shopping Assistant",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -76,8 +94,9 @@ async def stt_transcribe(file: UploadFile = File(...)):
         raise HTTPException(status_code=413, detail=f"File too large (> {MAX_UPLOAD_MB}MB)")
 
     try:
-        result = transcribe_audio(contents, detect_language=True)
-        return JSONResponse(content=result.model_dump())
+        # Whisper inference is blocking; run it off the event loop
+        result = await asyncio.to_thread(transcribe_audio, contents, detect_language=True)
+        return ORJSONResponse(content=result.model_dump())
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Transcription failed: {str(e)}")
 
@@ -111,7 +130,7 @@ async def voice_understand(
         raise HTTPException(status_code=413, detail=f"File too large (> {MAX_UPLOAD_MB}MB)")
 
     # Transcribe audio
-    stt_result = transcribe_audio(contents, detect_language=True)
+    stt_result = await asyncio.to_thread(transcribe_audio, contents, detect_language=True)
     transcript_text = stt_result.text or ""
 
     # Process the transcript
@@ -125,8 +144,6 @@ async def voice_understand(
     # Search for products if the intent is product-related
     if query_response.intent in ["search_product", "add_to_cart"] and transcript_text.strip():
         try:
-            from .product_finder import search_products
-            
             # Build search request from query processing results
             search_request = ProductSearchRequest(
                 query=transcript_text,  # Use original transcript as search query
@@ -143,7 +160,7 @@ async def voice_understand(
             product_search_performed = True
             
         except Exception as e:
-            print(f"Product search failed: {e}")
+            logger.warning("Product search failed: %s", e)
             # Continue without products if search fails
             pass
 
@@ -162,10 +179,10 @@ async def search_products_endpoint(request: ProductSearchRequest):
     Search for products based on query and filters.
     """
     try:
-        from .product_finder import search_products
         result = await search_products(request)
         return result
     except Exception as e:
+        logger.warning("Product search failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Product search failed: {str(e)}")
 
 # Product details endpoint
@@ -175,10 +192,10 @@ async def get_product_details_endpoint(product_id: str, source: str = "fakestore
     Get detailed information about a specific product.
     """
     try:
-        from .product_finder import get_product_details
         result = await get_product_details(product_id, source)
         return result
     except Exception as e:
+        logger.warning("Failed to get product details: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get product details: {str(e)}")
 
 # Product categories endpoint
@@ -188,11 +205,11 @@ async def get_product_categories():
     Get available product categories.
     """
     try:
-        from .product_finder import get_categories
         categories = await get_categories()
         return {
             "categories": categories,
             "total": len(categories)
         }
     except Exception as e:
+        logger.warning("Failed to get categories: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get categories: {str(e)}")
@@ -1,6 +1,6 @@
 # app/models.py - Data models for unified service
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Any, Dict, List
 
 # Transcription models
@@ -33,6 +33,10 @@ class QueryResponse(BaseModel):
 
 # Product models
 class Product(BaseModel):
+    # Products are never mutated after the API clients build them. Freezing
+    # lets cached search results share them instead of deep-copying.
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     id: str
     title: str
     price: float
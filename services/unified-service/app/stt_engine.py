@@ -1,16 +1,28 @@
 import io
+import threading
 import time
 from typing import Tuple, List
-from faster_whisper import WhisperModel
 from .config import STT_MODEL_SIZE, STT_DEVICE, STT_COMPUTE_TYPE
 from .models import TranscriptionResult, TranscriptionSegment
 
-# Initialize model once at startup
-model = WhisperModel(
-    STT_MODEL_SIZE,
-    device=STT_DEVICE,          # "auto" picks best
-    compute_type=STT_COMPUTE_TYPE
-)
+# The model is loaded on first use, so importing this module (and booting
+# routes that never transcribe) doesn't pay for faster-whisper
+_model = None
+_model_lock = threading.Lock()
+
+def _get_model():
+    """Create and cache the Whisper model (thread-safe)."""
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                from faster_whisper import WhisperModel
+                _model = WhisperModel(
+                    STT_MODEL_SIZE,
+                    device=STT_DEVICE,          # "auto" picks best
+                    compute_type=STT_COMPUTE_TYPE
+                )
+    return _model
 
 ALLOWED_MIME_TYPES = {
     "audio/wav", "audio/x-wav",
@@ -27,7 +39,7 @@ def transcribe_audio(file_bytes: bytes, detect_language: bool = True) -> Transcr
     # faster-whisper can accept a bytes-like object via file object
     audio_fp = io.BytesIO(file_bytes)
     t0 = time.time()
-    segments, info = model.transcribe(audio_fp, beam_size=5, vad_filter=True)
+    segments, info = _get_model().transcribe(audio_fp, beam_size=5, vad_filter=True)
     duration = time.time() - t0
 
     segs: List[TranscriptionSegment] = []
@@ -1,5 +1,6 @@
 # app/main.py  (voice-agent) - Pure Speech-to-Text Service
 
+import asyncio
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.responses import JSONResponse
@@ -53,7 +54,8 @@ async def stt_transcribe(file: UploadFile = File(...)):
         raise HTTPException(status_code=413, detail=f"File too large (> {MAX_UPLOAD_MB}MB)")
 
     try:
-        result = transcribe_audio(contents, detect_language=True)
+        # Whisper inference is blocking; run it off the event loop
+        result = await asyncio.to_thread(transcribe_audio, contents, detect_language=True)
         return JSONResponse(content=result.model_dump())
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Transcription failed: {str(e)}")